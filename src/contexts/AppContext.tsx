@@ -216,10 +216,13 @@ export const AppProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     const scoreMultiplier = ecoScore.combined_score / 100; // AI score multiplier
     const finalCredits = Math.round(baseCredits * scoreMultiplier * 10) / 10;
     
+    // Share one timestamp between the plantation and its earned-credit transaction
+    const now = new Date();
+    
     const newPlantation: PlantationData = {
       ...data,
-      id: Date.now().toString(),
-      timestamp: new Date(),
+      id: now.getTime().toString(),
+      timestamp: now,
       creditsEarned: finalCredits,
       status: 'pending',
       ecoScore
@@ -229,11 +232,11 @@ export const AppProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
 
     // Add transaction for earned credits
     const newTransaction: Transaction = {
-      id: Date.now().toString(),
+      id: now.getTime().toString(),
       type: 'earned',
       ngoId: data.ngoId,
       credits: newPlantation.creditsEarned,
-      timestamp: new Date(),
+      timestamp: now,
       blockchainHash: '0x' + Math.random().toString(16).substr(2, 40).toUpperCase()
     };
 